@@ -1,7 +1,4 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
 from onboarding import show_onboarding
 from product_catalog import show_product_catalog
 from product_detail import show_product_detail
@@ -18,6 +15,85 @@ from synergyze_landing import show_synergyze_landing
 from hsn_transaction_system import show_hsn_transaction_system
 from emperor_timeline import show_emperor_timeline
 
+# Sidebar access levels: label -> (user_role, is_authenticated, landing page).
+# ACCESS_INDEX_BY_ROLE is the reverse index used to preselect the current level.
+ACCESS_LEVELS = {
+    'Public View': ('public', False, 'vsr_landing'),
+    'Licensed User': ('licensed', True, 'virtual_silk_road'),
+    'Emperor Access': ('emperor', True, 'virtual_silk_road'),
+}
+ACCESS_OPTIONS = list(ACCESS_LEVELS)
+ACCESS_INDEX_BY_ROLE = {role: i for i, (role, _, _) in enumerate(ACCESS_LEVELS.values())}
+
+# Demo disclaimer shown under the access selector, pre-formatted per
+# non-public role
+ACCESS_NOTE_TEMPLATE = """
+<div style='background-color: rgba(255, 230, 153, 0.2); padding: 10px; border-radius: 5px; border-left: 3px solid #FFD700; margin-top: 10px;'>
+    <p style='margin: 0; font-size: 0.8em;'><b>Note:</b> You're viewing the {0} interface. In production, this would require proper authentication.</p>
+</div>
+"""
+ACCESS_NOTES = {
+    'licensed': ACCESS_NOTE_TEMPLATE.format("Licensed User"),
+    'emperor': ACCESS_NOTE_TEMPLATE.format("Emperor"),
+}
+
+# Footer captions for the Empire ecosystem pages, which also show the
+# ecosystem hierarchy below
+FOOTER_CAPTIONS = {
+    'empire_os_landing': "Empire OS | The Ultimate Enterprise Governance Operating System | © 2025 Imperial Technology",
+    'vsr_landing': "Virtual Silk Road | Powered by Empire OS | © 2025 Imperial Technology",
+    'virtual_silk_road': "Virtual Silk Road | Powered by Empire OS | © 2025 Imperial Technology",
+    'synergyze_landing': "Synergyze Licenses | Deployed on the Virtual Silk Road | Powered by Empire OS | © 2025 Imperial Technology",
+    'license_management': "Synergyze Licenses | Deployed on the Virtual Silk Road | Powered by Empire OS | © 2025 Imperial Technology",
+    'emperor_timeline': "Emperor Timeline | ECG Governance Layer | Licensed by Synergyze | © 2025 Imperial Technology",
+    'empire_os_dashboard': "Empire Ecosystem | © 2025 Imperial Technology",
+}
+PORTAL_FOOTER_CAPTION = "Buying House Portal | Ready Styles. Bulk Orders. Tailored For You."
+ECOSYSTEM_HIERARCHY_HTML = """
+<div style="text-align: center; margin-bottom: 10px;">
+    <div style="display: inline-flex; align-items: center; justify-content: center; gap: 15px;">
+        <div style="text-align: center;">
+            <span style="font-weight: bold; color: gold; font-size: 0.9em;">👑 EMPIRE OS</span><br>
+            <span style="font-size: 0.7em; color: #666;">Operating System</span>
+        </div>
+        <div style="color: #999;">→</div>
+        <div style="text-align: center;">
+            <span style="font-weight: bold; color: #4B0082; font-size: 0.9em;">🌏 VIRTUAL SILK ROAD</span><br>
+            <span style="font-size: 0.7em; color: #666;">Network</span>
+        </div>
+        <div style="color: #999;">→</div>
+        <div style="text-align: center;">
+            <span style="font-weight: bold; color: #8A2BE2; font-size: 0.9em;">⚡ SYNERGYZE</span><br>
+            <span style="font-size: 0.7em; color: #666;">Licenses</span>
+        </div>
+    </div>
+</div>
+"""
+
+# Sidebar button callbacks. They run before the next rerun, so the new state
+# is already in place when the script redraws and no extra st.rerun() is needed.
+def switch_access_level(selected_access):
+    """Apply the access level picked in the sidebar selector."""
+    role, authenticated, landing_page = ACCESS_LEVELS[selected_access]
+    st.session_state.user_role = role
+    st.session_state.is_authenticated = authenticated
+    st.session_state.page = landing_page
+
+def reset_application():
+    """Return the session to the public landing page with an empty order."""
+    st.session_state.page = 'vsr_landing'
+    st.session_state.completed_onboarding = False
+    st.session_state.selected_product = None
+    st.session_state.cart = []
+    st.session_state.order_submitted = False
+    st.session_state.user_role = 'public'
+    st.session_state.is_authenticated = False
+    # Reset merchandiser info
+    if 'merchandiser' in st.session_state:
+        del st.session_state.merchandiser
+    if 'conversation' in st.session_state:
+        del st.session_state.conversation
+
 # Configure the page
 st.set_page_config(
     page_title="Synergyze | Virtual Silk Road",
@@ -26,28 +102,24 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state for app flow
-if 'page' not in st.session_state:
-    st.session_state.page = 'retailer_analysis'  # Start directly on retailer analysis page for testing
-
-if 'completed_onboarding' not in st.session_state:
-    st.session_state.completed_onboarding = True  # Skip onboarding for testing
+# Initialize session state for app flow and access control. The sentinel
+# key makes this a single lookup on every rerun after the first.
+if '_app_initialized' not in st.session_state:
+    for key, value in {
+        'page': 'retailer_analysis',  # Start directly on retailer analysis page for testing
+        'completed_onboarding': True,  # Skip onboarding for testing
+        'selected_product': None,
+        'cart': [],
+        'order_submitted': False,
+        'is_authenticated': False,
+        'user_role': 'public',  # Options: 'public', 'licensed', 'emperor'
+    }.items():
+        st.session_state.setdefault(key, value)
+    st.session_state._app_initialized = True
 
-if 'selected_product' not in st.session_state:
-    st.session_state.selected_product = None
-
-if 'cart' not in st.session_state:
-    st.session_state.cart = []
-
-if 'order_submitted' not in st.session_state:
-    st.session_state.order_submitted = False
-
-# Initialize new session state for authentication and access control
-if 'is_authenticated' not in st.session_state:
-    st.session_state.is_authenticated = False
-
-if 'user_role' not in st.session_state:
-    st.session_state.user_role = 'public'  # Options: 'public', 'licensed', 'emperor'
+# The role only changes in the sidebar callbacks, which run before the script
+# does, so one read serves the whole rerun
+user_role = st.session_state.user_role
 
 # Sidebar navigation
 with st.sidebar:
@@ -63,7 +135,7 @@ with st.sidebar:
     st.markdown("---")
     
     # Main navigation sections
-    if st.session_state.user_role == 'public':
+    if user_role == 'public':
         # Public-facing marketing pages for the ecosystem
         st.markdown("### Empire Ecosystem")
         
@@ -140,109 +212,78 @@ with st.sidebar:
     st.markdown("### User Access")
     
     # Simple authentication UI for demo purposes
-    access_options = ['Public View', 'Licensed User', 'Emperor Access']
     selected_access = st.selectbox(
         "Select Access Level:",
-        access_options,
-        index=0 if st.session_state.user_role == 'public' else 
-              1 if st.session_state.user_role == 'licensed' else 2
+        ACCESS_OPTIONS,
+        # Unrecognised roles preselect the last level, as the original chain did
+        index=ACCESS_INDEX_BY_ROLE.get(user_role, ACCESS_INDEX_BY_ROLE['emperor'])
     )
     
-    if st.button("Switch Access Level", use_container_width=True):
-        if selected_access == 'Public View':
-            st.session_state.user_role = 'public'
-            st.session_state.is_authenticated = False
-            st.session_state.page = 'vsr_landing'  # Default to landing page for public users
-        elif selected_access == 'Licensed User':
-            st.session_state.user_role = 'licensed'
-            st.session_state.is_authenticated = True
-            st.session_state.page = 'virtual_silk_road'  # Default to VSR for licensed users
-        else:  # Emperor Access
-            st.session_state.user_role = 'emperor'
-            st.session_state.is_authenticated = True
-            st.session_state.page = 'virtual_silk_road'  # Default to VSR for emperor too
-        st.rerun()
+    st.button("Switch Access Level", use_container_width=True,
+              on_click=switch_access_level, args=(selected_access,))
     
     # Disclaimer for demo
-    if st.session_state.user_role != 'public':
-        st.markdown("""
-        <div style='background-color: rgba(255, 230, 153, 0.2); padding: 10px; border-radius: 5px; border-left: 3px solid #FFD700; margin-top: 10px;'>
-            <p style='margin: 0; font-size: 0.8em;'><b>Note:</b> You're viewing the {0} interface. In production, this would require proper authentication.</p>
-        </div>
-        """.format(
-            "Emperor" if st.session_state.user_role == 'emperor' else "Licensed User"
-        ), unsafe_allow_html=True)
+    access_note = ACCESS_NOTES.get(user_role)
+    if access_note:
+        st.markdown(access_note, unsafe_allow_html=True)
                 
     # Reset button at the bottom
     st.markdown("---")
-    if st.button("🔄 Reset Application", use_container_width=True):
-        st.session_state.page = 'vsr_landing'
-        st.session_state.completed_onboarding = False
-        st.session_state.selected_product = None
-        st.session_state.cart = []
-        st.session_state.order_submitted = False
-        st.session_state.user_role = 'public'
-        st.session_state.is_authenticated = False
-        # Reset merchandiser info
-        if 'merchandiser' in st.session_state:
-            del st.session_state.merchandiser
-        if 'conversation' in st.session_state:
-            del st.session_state.conversation
-        st.rerun()
+    st.button("🔄 Reset Application", use_container_width=True, on_click=reset_application)
 
-# Set default page if none is selected
-if 'page' not in st.session_state:
-    st.session_state.page = 'vsr_landing'  # Default to the public landing page
+# The sidebar buttons above may have just changed the page, so read it only
+# now; routing and the footer share this one read
+page = st.session_state.page
 
 # Main content area based on the current page
-if st.session_state.page == 'onboarding':
+if page == 'onboarding':
     show_onboarding()
-elif st.session_state.page == 'product_catalog':
+elif page == 'product_catalog':
     show_product_catalog()
-elif st.session_state.page == 'product_detail':
+elif page == 'product_detail':
     show_product_detail()
-elif st.session_state.page == 'order_booking':
+elif page == 'order_booking':
     show_order_booking()
-elif st.session_state.page == 'order_confirmation':
+elif page == 'order_confirmation':
     show_order_confirmation()
-elif st.session_state.page == 'merchandiser_agent':
+elif page == 'merchandiser_agent':
     show_merchandiser_agent()
-elif st.session_state.page == 'retailer_analysis':
+elif page == 'retailer_analysis':
     show_retailer_analysis()
-elif st.session_state.page == 'stock_analysis':
+elif page == 'stock_analysis':
     show_stock_analysis()
-elif st.session_state.page == 'visualization':
+elif page == 'visualization':
     show_visualization()
-elif st.session_state.page == 'hsn_transaction_system':
+elif page == 'hsn_transaction_system':
     show_hsn_transaction_system()
 # Empire Ecosystem pages
-elif st.session_state.page == 'empire_os_landing':
+elif page == 'empire_os_landing':
     show_empire_os_landing()  # Public marketing page for Empire OS
-elif st.session_state.page == 'vsr_landing':
+elif page == 'vsr_landing':
     show_virtual_silk_road_landing()  # Public marketing page for Virtual Silk Road
-elif st.session_state.page == 'synergyze_landing':
+elif page == 'synergyze_landing':
     show_synergyze_landing()  # Public marketing page for Synergyze Licenses
 
 # Private access dashboards
-elif st.session_state.page == 'virtual_silk_road':
+elif page == 'virtual_silk_road':
     # Check if user has proper access
-    if st.session_state.user_role in ['licensed', 'emperor']:
+    if user_role in ['licensed', 'emperor']:
         show_virtual_silk_road()  # Private Emperor's view
     else:
         # Redirect unauthorized users to the public landing
         st.warning("⚠️ You need licensed access to view the Emperor's Virtual Silk Road dashboard.")
         show_virtual_silk_road_landing()
 # Emperor control dashboards - redirect if no access
-elif st.session_state.page in ['empire_os_dashboard', 'license_management', 'emperor_timeline']:
-    if st.session_state.user_role == 'emperor':
+elif page in ['empire_os_dashboard', 'license_management', 'emperor_timeline']:
+    if user_role == 'emperor':
         # Show the Emperor's dashboard
         from empire_os_dashboard import show_empire_os_dashboard, show_license_dashboard
         
-        if st.session_state.page == 'empire_os_dashboard':
+        if page == 'empire_os_dashboard':
             show_empire_os_dashboard()
-        elif st.session_state.page == 'license_management':
+        elif page == 'license_management':
             show_license_dashboard()
-        elif st.session_state.page == 'emperor_timeline':
+        elif page == 'emperor_timeline':
             show_emperor_timeline()
     else:
         # Redirect unauthorized users
@@ -255,41 +296,11 @@ else:
 # Footer - dynamically change based on the current section
 st.markdown("---")
 
-# Create a universal ecosystem diagram at the bottom of all pages
-if st.session_state.page in ['empire_os_landing', 'vsr_landing', 'synergyze_landing', 'virtual_silk_road', 'empire_os_dashboard', 'license_management', 'emperor_timeline']:
-    # Show the ecosystem hierarchy for all Imperial pages
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 10px;">
-        <div style="display: inline-flex; align-items: center; justify-content: center; gap: 15px;">
-            <div style="text-align: center;">
-                <span style="font-weight: bold; color: gold; font-size: 0.9em;">👑 EMPIRE OS</span><br>
-                <span style="font-size: 0.7em; color: #666;">Operating System</span>
-            </div>
-            <div style="color: #999;">→</div>
-            <div style="text-align: center;">
-                <span style="font-weight: bold; color: #4B0082; font-size: 0.9em;">🌏 VIRTUAL SILK ROAD</span><br>
-                <span style="font-size: 0.7em; color: #666;">Network</span>
-            </div>
-            <div style="color: #999;">→</div>
-            <div style="text-align: center;">
-                <span style="font-weight: bold; color: #8A2BE2; font-size: 0.9em;">⚡ SYNERGYZE</span><br>
-                <span style="font-size: 0.7em; color: #666;">Licenses</span>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Different footers based on the specific ecosystem page
-    if st.session_state.page == 'empire_os_landing':
-        st.caption("Empire OS | The Ultimate Enterprise Governance Operating System | © 2025 Imperial Technology")
-    elif st.session_state.page in ['vsr_landing', 'virtual_silk_road']:
-        st.caption("Virtual Silk Road | Powered by Empire OS | © 2025 Imperial Technology")
-    elif st.session_state.page in ['synergyze_landing', 'license_management']:
-        st.caption("Synergyze Licenses | Deployed on the Virtual Silk Road | Powered by Empire OS | © 2025 Imperial Technology")
-    elif st.session_state.page == 'emperor_timeline':
-        st.caption("Emperor Timeline | ECG Governance Layer | Licensed by Synergyze | © 2025 Imperial Technology")
-    else:
-        st.caption("Empire Ecosystem | © 2025 Imperial Technology")
+# Ecosystem pages get the hierarchy diagram and their own caption; every
+# other page is part of the buying house portal
+caption = FOOTER_CAPTIONS.get(page)
+if caption:
+    st.markdown(ECOSYSTEM_HIERARCHY_HTML, unsafe_allow_html=True)
+    st.caption(caption)
 else:
-    # For other portal pages not directly related to the Empire ecosystem
-    st.caption("Buying House Portal | Ready Styles. Bulk Orders. Tailored For You.")
+    st.caption(PORTAL_FOOTER_CAPTION)
@@ -1,10 +1,5 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-import plotly.express as px
-import time
 
 def show_empire_os_landing():
     """Display the public landing page for Empire OS - The operating system owned by the Emperor"""
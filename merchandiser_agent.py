@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import random
 from datetime import datetime, timedelta
 
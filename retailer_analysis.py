@@ -5,7 +5,7 @@ import yfinance as yf
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
-from visualization import calculate_moving_averages, calculate_rsi, create_candlestick_chart, create_technical_chart, create_rsi_chart
+from visualization import compute_all_indicators, create_candlestick_chart, create_technical_chart, create_rsi_chart
 
 def show_retailer_analysis():
     """Display the ECG Market Health Check for major clothing retailers"""
@@ -179,14 +179,13 @@ def show_jcpenney_analysis():
                         display_stock_info(spg_data, "SPG")
                         
                         # Create technical analysis charts
-                        spg_data_ma = calculate_moving_averages(spg_data)
-                        spg_data_ma['RSI'] = calculate_rsi(spg_data)
+                        spg_indicators = compute_all_indicators("SPG", spg_data)
                         
                         # Display charts
                         st.subheader("Technical Analysis")
-                        st.plotly_chart(create_candlestick_chart(spg_data, "Simon Property Group Price (SPG)"), use_container_width=True)
-                        st.plotly_chart(create_technical_chart(spg_data_ma, "Simon Property Group with Moving Averages"), use_container_width=True)
-                        st.plotly_chart(create_rsi_chart(spg_data_ma, "Simon Property Group RSI"), use_container_width=True)
+                        st.plotly_chart(create_candlestick_chart(spg_data, spg_indicators, "Simon Property Group Price (SPG)"), use_container_width=True)
+                        st.plotly_chart(create_technical_chart(spg_data, spg_indicators, "Simon Property Group with Moving Averages"), use_container_width=True)
+                        st.plotly_chart(create_rsi_chart(spg_data, spg_indicators, "Simon Property Group RSI"), use_container_width=True)
                         
                         # Relationship to JC Penney
                         st.subheader("Relationship to JC Penney")
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import yfinance as yf
 import plotly.graph_objects as go
 
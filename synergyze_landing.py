@@ -1,7 +1,5 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 def show_synergyze_landing():
     """Display the public landing page for Synergyze - The licenses sold through the Virtual Silk Road"""
@@ -135,7 +133,9 @@ def show_synergyze_landing():
     with roi_col1:
         st.markdown("### Calculate Your Synergyze ROI")
         
-        # Create a simple ROI chart
+        # Create a simple ROI chart. matplotlib is imported here, on first
+        # use, so it stays off the app's startup path.
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots(figsize=(10, 6))
         
         # Sample ROI data
@@ -1,9 +1,220 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
-import time
 import plotly.graph_objects as go
-import plotly.express as px
+
+# Background colours for the compliance-issue severity column
+SEVERITY_COLORS = {"Low": "green", "Medium": "orange", "High": "red"}
+
+# Charts on this page are display-only, so skip Plotly's interaction wiring
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Emoji indicators for administrator status colours
+STATUS_INDICATORS = {"gold": "🟡", "green": "🟢", "orange": "🟠", "red": "🔴"}
+
+def color_severity(val):
+    """Return the cell style for a compliance-issue severity value."""
+    return f"background-color: {SEVERITY_COLORS.get(val, 'white')}; color: white;"
+
+# Ecosystem network: the Emperor sits at the centre and the remaining nodes
+# are evenly spaced on a circle around it. The graph never changes, so the
+# layout is computed once at import time instead of on every rerun.
+ECO_NODES = ('Manufacturing', 'Retail', 'Finance', 'Logistics',
+             'Marketing', 'Compliance', 'Emperor', 'Software')
+EMPEROR_IDX = ECO_NODES.index('Emperor')
+ECO_LABELS = list(ECO_NODES)
+
+def _ecosystem_edges():
+    """Emperor connects to every node; the other nodes form a chain."""
+    n = len(ECO_NODES)
+    edges = [(EMPEROR_IDX, i) for i in range(n) if i != EMPEROR_IDX]
+    edges += [(i, i+1) for i in range(n-2)]
+    return np.array(edges, dtype=np.int32)
+
+def _ecosystem_positions():
+    """Return an (n, 2) array of node coordinates indexed by node position."""
+    pos = np.zeros((len(ECO_NODES), 2))
+    ring = [i for i in range(len(ECO_NODES)) if i != EMPEROR_IDX]
+    angles = np.linspace(0, 2 * np.pi, len(ring), endpoint=False)
+    pos[ring, 0] = 0.5 * np.cos(angles)
+    pos[ring, 1] = 0.5 * np.sin(angles)
+    return pos
+
+def _edge_coordinates(pos, edges):
+    """Flatten edges into Plotly line coordinates, NaN-separated per segment."""
+    segments = np.full((len(edges), 3, 2), np.nan)
+    segments[:, 0] = pos[edges[:, 0]]
+    segments[:, 1] = pos[edges[:, 1]]
+    return segments[:, :, 0].ravel(), segments[:, :, 1].ravel()
+
+ECO_EDGES = _ecosystem_edges()
+ECO_POS = _ecosystem_positions()
+ECO_EDGE_X, ECO_EDGE_Y = _edge_coordinates(ECO_POS, ECO_EDGES)
+ECO_NODE_COLOR = ['gold' if n == 'Emperor' else 'steelblue' for n in ECO_NODES]
+ECO_NODE_SIZE = [25 if n == 'Emperor' else 15 for n in ECO_NODES]
+
+def build_ecosystem_figure():
+    """Build the Plotly figure for the ecosystem network."""
+    edge_trace = go.Scatter(
+        x=ECO_EDGE_X, y=ECO_EDGE_Y,
+        line=dict(width=1, color='rgba(150, 150, 150, 0.7)'),
+        hoverinfo='none',
+        mode='lines')
+
+    node_trace = go.Scatter(
+        x=ECO_POS[:, 0], y=ECO_POS[:, 1],
+        mode='markers+text',
+        text=ECO_LABELS,
+        textposition="top center",
+        marker=dict(
+            showscale=False,
+            color=ECO_NODE_COLOR,
+            size=ECO_NODE_SIZE,
+            line=dict(width=1, color='rgba(50, 50, 50, 0.8)')),
+        hoverinfo='text',
+        textfont=dict(size=11))
+
+    fig = go.Figure(data=[edge_trace, node_trace],
+                    layout=go.Layout(
+                        title=dict(text="Empire OS Ecosystem Visualization", font=dict(size=16)),
+                        showlegend=False,
+                        hovermode='closest',
+                        margin=dict(b=20, l=5, r=5, t=40),
+                        annotations=[dict(
+                            text="",
+                            showarrow=False,
+                            xref="paper", yref="paper")],
+                        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                        height=500,
+                        plot_bgcolor='rgba(255, 255, 255, 0.95)')
+                    )
+    return fig
+
+@st.cache_resource
+def ecosystem_network_html():
+    """Render the ecosystem network figure to an embeddable HTML fragment once."""
+    fig = build_ecosystem_figure()
+    return fig.to_html(include_plotlyjs='cdn', full_html=False, div_id='eco',
+                       config=dict(STATIC_CHART_CONFIG, responsive=True))
+
+LICENSE_TYPES = [
+    "Manufacturing Access License", 
+    "Retail Distribution License",
+    "Empire OS Core License",
+    "Financial Oversight License",
+    "Marketing Portal License",
+    "Supply Chain Visualization License"
+]
+
+# The tables below are static; caching them to disk keeps the built frames
+# across server restarts instead of rebuilding them on every rerun.
+@st.cache_data(persist='disk')
+def license_table():
+    """License status table for the License Management tab."""
+    return pd.DataFrame({
+        "License Type": LICENSE_TYPES,
+        "Active Instances": [42, 156, 3, 18, 24, 81],
+        "Usage %": [78, 92, 100, 45, 63, 87],
+        "Monthly Cost": ["$4,200", "$15,600", "$30,000", "$1,800", "$2,400", "$8,100"],
+        "Status": ["✅ Active", "✅ Active", "✅ Active", "⚠️ Underutilized", "✅ Active", "✅ Active"]
+    })
+
+@st.cache_data(persist='disk')
+def activation_table():
+    """Recent license activations."""
+    return pd.DataFrame({
+        "Entity": ["VOI Jeans Factory #3", "Retail Store #42", "Finance Department", "Marketing Team Alpha"],
+        "License Type": ["Manufacturing Access", "Retail Distribution", "Financial Oversight", "Marketing Portal"],
+        "Activated On": ["2025-03-30", "2025-03-28", "2025-03-25", "2025-03-22"],
+        "Activated By": ["Emperor", "CIO", "CFO", "Marketing Officer"]
+    })
+
+@st.cache_data(persist='disk')
+def compliance_issue_table():
+    """Active compliance issues shown in Governance Analytics."""
+    return pd.DataFrame({
+        "Issue ID": ["GOV-2324", "GOV-2310", "GOV-2298"],
+        "Department": ["Retail", "Marketing", "Manufacturing"],
+        "Description": [
+            "Missing quarterly retail inventory reconciliation",
+            "Unapproved marketing assets in circulation",
+            "Production process change without proper documentation"
+        ],
+        "Severity": ["Medium", "Low", "High"],
+        "Status": ["In Review", "Assigned", "In Progress"],
+        "Due Date": ["2025-04-10", "2025-04-15", "2025-04-05"]
+    })
+
+# Key ecosystem metric cards: (value, label, accent colour, background rgb)
+ECOSYSTEM_METRICS = [
+    ("$1.2M", "Revenue from License Fees", "#1E3A8A", "30, 58, 138"),
+    ("27", "Connected External Systems", "#4B0082", "75, 0, 130"),
+    ("98.3%", "Governance Compliance Rate", "#006400", "0, 100, 0"),
+]
+ECOSYSTEM_METRICS_HTML = "<div style='display: flex; gap: 1rem;'>" + "".join(
+    f"""
+    <div style='flex: 1; background-color: rgba({rgb}, 0.1); padding: 15px; border-radius: 5px; text-align: center;'>
+        <h3 style='margin-top: 0; color: {color};'>{value}</h3>
+        <p style='margin-bottom: 0;'>{label}</p>
+    </div>"""
+    for value, label, color, rgb in ECOSYSTEM_METRICS
+) + "</div>"
+
+# Feature comparison against competing governance solutions. The table is
+# read-only, so its DataFrame is built once at import time.
+COMPARISON_DATA = {
+    'Feature': [
+        'Unified Governance View',
+        'Real-time Supply Chain Insights',
+        'HSN Code Integration',
+        'Emperor-level Oversight',
+        'Marketing & Sales Portal',
+        'Custom License Templates',
+        'API-driven Architecture',
+        'ROI Analytics'
+    ],
+    'Virtual Silk Road': [
+        '✅ Included',
+        '✅ Included',
+        '✅ Included',
+        '✅ Included',
+        '✅ Included',
+        '✅ Included',
+        '✅ Included',
+        '✅ Included'
+    ],
+    'Competitors': [
+        '✅ $20,000+',
+        '❌ Extra Module',
+        '❌ Not Available',
+        '❌ Limited Access',
+        '❌ Separate System',
+        '❌ Fixed Templates',
+        '⚠️ Limited APIs',
+        '⚠️ Basic Only'
+    ]
+}
+COMPARISON_DF = pd.DataFrame(COMPARISON_DATA)
+
+@st.cache_data(ttl=3600)
+def review_month_options():
+    """Month choices for the review calendar, led by the current month."""
+    current_month = pd.Timestamp.now().strftime("%B %Y")
+    return [current_month, "May 2025", "June 2025", "July 2025"]
+
+@st.cache_data(ttl=86400)
+def api_usage_trend(day):
+    """
+    Sample 14-day API call trend ending on ``day`` (YYYY-MM-DD).
+    Seeded from the date so the series is stable within a day.
+    """
+    rng = np.random.default_rng(int(day.replace('-', '')))
+    return pd.DataFrame({
+        'Date': pd.date_range(end=pd.Timestamp(day), periods=14, freq='D'),
+        'API Calls': rng.integers(800, 1200, size=14) * 1000
+    })
 
 def show_virtual_silk_road():
     """
@@ -45,97 +256,8 @@ def show_virtual_silk_road():
         eco_col1, eco_col2 = st.columns([2, 1])
         
         with eco_col1:
-            # Create network visualization
-            nodes = {'Manufacturing': 0, 'Retail': 1, 'Finance': 2, 'Logistics': 3, 
-                    'Marketing': 4, 'Compliance': 5, 'Emperor': 6, 'Software': 7}
-            
-            # Create connections (edges) between nodes
-            edges = []
-            for i in range(len(nodes)-1):
-                # Emperor node connects to all other nodes
-                edges.append((nodes['Emperor'], i))
-                
-                # Other connections
-                if i < len(nodes)-2:
-                    edges.append((i, i+1))
-            
-            # Create labels and positions for nodes
-            labels = list(nodes.keys())
-            pos = {}
-            
-            # Place Emperor node in center
-            pos[nodes['Emperor']] = [0, 0]
-            
-            # Place other nodes in a circle around Emperor
-            angle_step = 2 * np.pi / (len(nodes) - 1)
-            for i, node in enumerate([n for n in nodes.keys() if n != 'Emperor']):
-                angle = i * angle_step
-                pos[nodes[node]] = [0.5 * np.cos(angle), 0.5 * np.sin(angle)]
-            
-            # Create a graph using plotly
-            edge_x = []
-            edge_y = []
-            for edge in edges:
-                x0, y0 = pos[edge[0]]
-                x1, y1 = pos[edge[1]]
-                edge_x.extend([x0, x1, None])
-                edge_y.extend([y0, y1, None])
-                
-            edge_trace = go.Scatter(
-                x=edge_x, y=edge_y,
-                line=dict(width=1, color='rgba(150, 150, 150, 0.7)'),
-                hoverinfo='none',
-                mode='lines')
-            
-            node_x = []
-            node_y = []
-            node_color = []
-            node_size = []
-            
-            for node in nodes:
-                x, y = pos[nodes[node]]
-                node_x.append(x)
-                node_y.append(y)
-                # Emperor node is gold
-                if node == 'Emperor':
-                    node_color.append('gold')
-                    node_size.append(25)
-                else:
-                    node_color.append('steelblue')
-                    node_size.append(15)
-            
-            node_trace = go.Scatter(
-                x=node_x, y=node_y,
-                mode='markers+text',
-                text=labels,
-                textposition="top center",
-                marker=dict(
-                    showscale=False,
-                    color=node_color,
-                    size=node_size,
-                    line=dict(width=1, color='rgba(50, 50, 50, 0.8)')),
-                hoverinfo='text',
-                textfont=dict(size=11))
-            
-            # Create the figure
-            fig = go.Figure(data=[edge_trace, node_trace],
-                            layout=go.Layout(
-                                title="Empire OS Ecosystem Visualization",
-                                titlefont=dict(size=16),
-                                showlegend=False,
-                                hovermode='closest',
-                                margin=dict(b=20, l=5, r=5, t=40),
-                                annotations=[dict(
-                                    text="",
-                                    showarrow=False,
-                                    xref="paper", yref="paper")],
-                                xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                                height=500,
-                                plot_bgcolor='rgba(255, 255, 255, 0.95)')
-                            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            # The network is static, so it is served as pre-rendered HTML
+            components.html(ecosystem_network_html(), height=520)
         
         with eco_col2:
             st.subheader("System Status")
@@ -154,45 +276,27 @@ def show_virtual_silk_road():
                 "Marketing Officer": {"status": "Offline", "last_active": "3h ago", "color": "red"}
             }
             
-            # Display admin status with colored indicators
-            for admin, data in admins.items():
-                st.markdown(f"""
-                <div style='display: flex; align-items: center;'>
-                    <div style='width: 10px; height: 10px; border-radius: 50%; background-color: {data["color"]}; margin-right: 10px;'></div>
-                    <div style='flex-grow: 1;'><b>{admin}</b> <span style='color: gray; font-size: 0.8em;'>({data["status"]})</span></div>
-                    <div style='color: gray; font-size: 0.8em;'>{data["last_active"]}</div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Display admin status as a single table with colored indicators
+            admins_df = pd.DataFrame([
+                {"Admin": admin,
+                 "Status": f"{STATUS_INDICATORS.get(data['color'], '⚪')} {data['status']}",
+                 "Last Active": data["last_active"]}
+                for admin, data in admins.items()
+            ])
+            st.dataframe(
+                admins_df,
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "Last Active": st.column_config.TextColumn("Last Active", width="small")
+                }
+            )
         
         # Additional ecosystem metrics
         st.subheader("Key Ecosystem Metrics")
         
-        # Create three columns for metrics
-        metric_cols = st.columns(3)
-        
-        with metric_cols[0]:
-            st.markdown("""
-            <div style='background-color: rgba(30, 58, 138, 0.1); padding: 15px; border-radius: 5px; text-align: center;'>
-                <h3 style='margin-top: 0; color: #1E3A8A;'>$1.2M</h3>
-                <p style='margin-bottom: 0;'>Revenue from License Fees</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        with metric_cols[1]:
-            st.markdown("""
-            <div style='background-color: rgba(75, 0, 130, 0.1); padding: 15px; border-radius: 5px; text-align: center;'>
-                <h3 style='margin-top: 0; color: #4B0082;'>27</h3>
-                <p style='margin-bottom: 0;'>Connected External Systems</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        with metric_cols[2]:
-            st.markdown("""
-            <div style='background-color: rgba(0, 100, 0, 0.1); padding: 15px; border-radius: 5px; text-align: center;'>
-                <h3 style='margin-top: 0; color: #006400;'>98.3%</h3>
-                <p style='margin-bottom: 0;'>Governance Compliance Rate</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Render the three metric cards as one flexbox block
+        st.markdown(ECOSYSTEM_METRICS_HTML, unsafe_allow_html=True)
     
     # Tab 2: License Management
     with tabs[1]:
@@ -200,25 +304,7 @@ def show_virtual_silk_road():
         st.write("Emperor-level control over all license allocations, permissions, and restrictions.")
         
         # License management interface
-        license_types = [
-            "Manufacturing Access License", 
-            "Retail Distribution License",
-            "Empire OS Core License",
-            "Financial Oversight License",
-            "Marketing Portal License",
-            "Supply Chain Visualization License"
-        ]
-        
-        # License status table
-        license_data = {
-            "License Type": license_types,
-            "Active Instances": [42, 156, 3, 18, 24, 81],
-            "Usage %": [78, 92, 100, 45, 63, 87],
-            "Monthly Cost": ["$4,200", "$15,600", "$30,000", "$1,800", "$2,400", "$8,100"],
-            "Status": ["✅ Active", "✅ Active", "✅ Active", "⚠️ Underutilized", "✅ Active", "✅ Active"]
-        }
-        
-        df_licenses = pd.DataFrame(license_data)
+        df_licenses = license_table()
         
         # Style the dataframe
         st.dataframe(df_licenses, use_container_width=True)
@@ -230,7 +316,7 @@ def show_virtual_silk_road():
         
         with col1:
             # License allocation form
-            selected_license = st.selectbox("Select License Type", license_types)
+            selected_license = st.selectbox("Select License Type", LICENSE_TYPES)
             entity_name = st.text_input("Entity Name")
             duration = st.radio("License Duration", ["1 Month", "6 Months", "1 Year", "Perpetual"])
             permissions = st.multiselect("Permissions", ["View", "Edit", "Delete", "Admin", "API Access"])
@@ -275,14 +361,7 @@ def show_virtual_silk_road():
         st.subheader("Recent License Activations")
         
         # Sample activation data
-        activation_data = {
-            "Entity": ["VOI Jeans Factory #3", "Retail Store #42", "Finance Department", "Marketing Team Alpha"],
-            "License Type": ["Manufacturing Access", "Retail Distribution", "Financial Oversight", "Marketing Portal"],
-            "Activated On": ["2025-03-30", "2025-03-28", "2025-03-25", "2025-03-22"],
-            "Activated By": ["Emperor", "CIO", "CFO", "Marketing Officer"]
-        }
-        
-        df_activations = pd.DataFrame(activation_data)
+        df_activations = activation_table()
         st.table(df_activations)
     
     # Tab 3: Governance Analytics
@@ -305,44 +384,49 @@ def show_virtual_silk_road():
                 "Compliance Rate": [97, 94, 99, 92, 88, 96]
             }
             
-            fig = px.bar(
-                dept_data, 
-                x="Department", 
-                y="Compliance Rate",
+            fig = go.Figure(go.Bar(
+                x=dept_data["Department"],
+                y=dept_data["Compliance Rate"],
+                marker=dict(
+                    color=dept_data["Compliance Rate"],
+                    colorscale="Viridis",
+                    showscale=True,
+                    colorbar=dict(title="Compliance Rate")
+                ),
+                text=dept_data["Compliance Rate"],
+                texttemplate='%{text}%',
+                textposition='outside'
+            ))
+            
+            fig.update_layout(
                 title="Department Compliance (%)",
-                color="Compliance Rate",
-                color_continuous_scale=px.colors.sequential.Viridis,
-                text="Compliance Rate"
+                xaxis_title="Department",
+                yaxis_title="Compliance Rate",
+                uniformtext_minsize=8,
+                uniformtext_mode='hide'
             )
             
-            fig.update_traces(texttemplate='%{text}%', textposition='outside')
-            fig.update_layout(uniformtext_minsize=8, uniformtext_mode='hide')
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
             
         with chart_col2:
             # API usage over time
             st.subheader("API Usage Trends")
             
-            # Generate some sample data
-            dates = pd.date_range(end=pd.Timestamp.now(), periods=14, freq='D')
-            api_calls = np.random.randint(800, 1200, size=14) * 1000
-            
-            # Create a dataframe
-            api_data = pd.DataFrame({
-                'Date': dates,
-                'API Calls': api_calls
-            })
+            # Sample data is stable for the day rather than redrawn per rerun
+            api_data = api_usage_trend(pd.Timestamp.now().strftime("%Y-%m-%d"))
             
-            fig = px.line(
-                api_data, 
-                x='Date', 
-                y='API Calls', 
+            fig = go.Figure(go.Scatter(
+                x=api_data['Date'],
+                y=api_data['API Calls'],
+                mode='lines+markers'
+            ))
+            fig.update_layout(
                 title='Daily API Calls (14-day trend)',
-                markers=True
+                xaxis_title='Date',
+                yaxis_title='API Calls'
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
         
         # Second row of charts
         chart_col3, chart_col4 = st.columns(2)
@@ -360,26 +444,29 @@ def show_virtual_silk_road():
             df_usage = pd.DataFrame(license_usage)
             df_usage["Utilization"] = (df_usage["Active"] / df_usage["Allocated"] * 100).round(1)
             
-            fig = px.bar(
-                df_usage,
-                x="License Type",
-                y=["Active", "Allocated"],
+            fig = go.Figure([
+                go.Bar(x=df_usage["License Type"], y=df_usage[col], name=col, opacity=0.7)
+                for col in ("Active", "Allocated")
+            ])
+            fig.update_layout(
                 title="License Allocation vs. Usage",
                 barmode="overlay",
-                opacity=0.7
+                xaxis_title="License Type",
+                yaxis_title="value",
+                legend_title_text="variable"
             )
             
-            # Add percentage labels
-            for i, row in df_usage.iterrows():
-                fig.add_annotation(
-                    x=row["License Type"],
-                    y=row["Active"],
-                    text=f"{row['Utilization']}%",
-                    showarrow=False,
-                    yshift=10
+            # Add percentage labels, built in one pass over the column arrays
+            fig.update_layout(annotations=[
+                dict(x=license_type, y=active, text=f"{utilization}%", showarrow=False, yshift=10)
+                for license_type, active, utilization in zip(
+                    df_usage["License Type"].to_numpy(),
+                    df_usage["Active"].to_numpy(),
+                    df_usage["Utilization"].to_numpy()
                 )
+            ])
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
             
         with chart_col4:
             # System health metrics
@@ -408,34 +495,19 @@ def show_virtual_silk_road():
                 }
             ))
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
         
         # Compliance issues table
         st.subheader("Active Compliance Issues")
         
         # Sample compliance issues
-        compliance_issues = {
-            "Issue ID": ["GOV-2324", "GOV-2310", "GOV-2298"],
-            "Department": ["Retail", "Marketing", "Manufacturing"],
-            "Description": [
-                "Missing quarterly retail inventory reconciliation",
-                "Unapproved marketing assets in circulation",
-                "Production process change without proper documentation"
-            ],
-            "Severity": ["Medium", "Low", "High"],
-            "Status": ["In Review", "Assigned", "In Progress"],
-            "Due Date": ["2025-04-10", "2025-04-15", "2025-04-05"]
-        }
-        
-        df_issues = pd.DataFrame(compliance_issues)
+        df_issues = compliance_issue_table()
         
-        # Apply color coding for severity
-        def color_severity(val):
-            color_map = {"Low": "green", "Medium": "orange", "High": "red"}
-            return f"background-color: {color_map.get(val, 'white')}; color: white;"
-        
-        # Display styled table
-        st.dataframe(df_issues, use_container_width=True)
+        # Display styled table (severity colouring applied once to the column)
+        st.dataframe(
+            df_issues.style.map(color_severity, subset=["Severity"]),
+            use_container_width=True
+        )
     
     # Tab 4: Review Calendar
     with tabs[3]:
@@ -443,8 +515,7 @@ def show_virtual_silk_road():
         st.write("Schedule and tracking for governance reviews conducted by the Emperor and the council of ministers.")
         
         # Filter by month
-        current_month = pd.Timestamp.now().strftime("%B %Y")
-        selected_month = st.selectbox("Select Month", [current_month, "May 2025", "June 2025", "July 2025"])
+        selected_month = st.selectbox("Select Month", review_month_options())
         
         # Create schedule calendar
         st.subheader(f"Review Schedule: {selected_month}")
@@ -521,44 +592,8 @@ def show_virtual_silk_road():
         # Comparison table
         st.markdown("### Competitive Advantage")
         
-        comparison_data = {
-            'Feature': [
-                'Unified Governance View',
-                'Real-time Supply Chain Insights',
-                'HSN Code Integration',
-                'Emperor-level Oversight',
-                'Marketing & Sales Portal',
-                'Custom License Templates',
-                'API-driven Architecture',
-                'ROI Analytics'
-            ],
-            'Virtual Silk Road': [
-                '✅ Included',
-                '✅ Included',
-                '✅ Included',
-                '✅ Included',
-                '✅ Included',
-                '✅ Included',
-                '✅ Included',
-                '✅ Included'
-            ],
-            'Competitors': [
-                '✅ $20,000+',
-                '❌ Extra Module',
-                '❌ Not Available',
-                '❌ Limited Access',
-                '❌ Separate System',
-                '❌ Fixed Templates',
-                '⚠️ Limited APIs',
-                '⚠️ Basic Only'
-            ]
-        }
-        
-        # Create DataFrame
-        df_comparison = pd.DataFrame(comparison_data)
-        
         # Display comparison
-        st.dataframe(df_comparison, hide_index=True)
+        st.dataframe(COMPARISON_DF, hide_index=True)
         
         # Pricing advantage message
         st.markdown("""
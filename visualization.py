@@ -1,53 +1,105 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 import numpy as np
-from datetime import datetime, timedelta
+from collections import namedtuple
 
-def calculate_moving_averages(df, windows=[20, 50, 200]):
-    """Calculate moving averages for the stock data"""
-    result = df.copy()
-    for window in windows:
-        result[f'MA{window}'] = result['Close'].rolling(window=window).mean()
-    return result
+MA_WINDOWS = (20, 50, 200)
+MA_COLORS = ['#F44336', '#4CAF50', '#FF9800']
+
+PerformanceMetrics = namedtuple(
+    'PerformanceMetrics',
+    ['total_return', 'annualized_return', 'volatility', 'sharpe_ratio', 'max_drawdown', 'avg_volume']
+)
 
+def calculate_moving_averages(close, windows=MA_WINDOWS):
+    """Calculate moving averages of a close price series, keyed by window"""
+    return {window: close.rolling(window=window).mean() for window in windows}
+
+@st.cache_data(show_spinner=False)
 def calculate_rsi(data, window=14):
-    """Calculate Relative Strength Index"""
+    """Calculate Relative Strength Index using Wilder's smoothing"""
     delta = data['Close'].diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
+    gain = delta.clip(lower=0)
+    loss = (-delta).clip(lower=0)
     
-    avg_gain = gain.rolling(window=window).mean()
-    avg_loss = loss.rolling(window=window).mean()
+    avg_gain = gain.ewm(alpha=1/window, adjust=False).mean()
+    avg_loss = loss.ewm(alpha=1/window, adjust=False).mean()
     
-    rs = avg_gain / avg_loss
+    # No losses in the window means RSI is pinned at 100 rather than inf/NaN
+    rs = avg_gain / avg_loss.replace(0, np.nan)
     rsi = 100 - (100 / (1 + rs))
+    rsi = rsi.where(avg_loss != 0, 100)
     
     return rsi
 
-def create_candlestick_chart(df, title):
+def max_drawdown(close):
+    """Maximum peak-to-trough decline of a price array, in percent"""
+    # fmax/nanmax skip NaN prices, so the peak starts at the first finite price
+    running_max = np.fmax.accumulate(close)
+    return np.nanmax((running_max - close) / running_max) * 100
+
+@st.cache_data(show_spinner=False)
+def downcast_ohlcv(df):
+    """Narrow OHLCV columns for plotting: float32 prices and the smallest safe integer volume"""
+    result = df.astype({col: 'float32' for col in ('Open', 'High', 'Low', 'Close') if col in df.columns})
+    if 'Volume' in result.columns:
+        result['Volume'] = pd.to_numeric(result['Volume'], downcast='integer')
+    return result
+
+@st.cache_data(show_spinner=False)
+def compute_all_indicators(ticker, df):
+    """Calculate the indicators shared by the charts and the performance summary"""
+    close = df['Close']
+    return {
+        'moving_averages': calculate_moving_averages(close),
+        'rsi': calculate_rsi(df),
+        'returns': close.pct_change().mul(100).dropna(),
+        # Explicit axis ranges spare the candlestick chart Plotly's autorange pass
+        'vol_max': float(df['Volume'].max()),
+        'x_range': (df.index[0], df.index[-1]),
+    }
+
+# Arguments prefixed with an underscore are not hashed by Streamlit's caches;
+# indicators are derived from df, which already keys the cache entry.
+@st.cache_data(show_spinner=False)
+def compute_metrics(ticker, df, _indicators):
+    """Calculate the performance summary metrics for a stock's price history"""
+    close = df['Close'].to_numpy(dtype=float)
+    
+    # Calculate performance metrics in NumPy from the shared indicators
+    total_return = (close[-1] / close[0] - 1) * 100
+    daily_returns = _indicators['returns'].to_numpy() / 100
+    annualized_return = daily_returns.mean() * 252 * 100
+    volatility = daily_returns.std(ddof=1) * np.sqrt(252) * 100
+    sharpe_ratio = annualized_return / volatility if volatility != 0 else 0
+    
+    return PerformanceMetrics(
+        total_return, annualized_return, volatility, sharpe_ratio, max_drawdown(close), df['Volume'].to_numpy().mean()
+    )
+
+# Figures are built once per loaded price history and kept in this
+# session's state by session_figure(), so the builders are not cached.
+def create_candlestick_chart(df, indicators, title):
     """Create an interactive candlestick chart"""
-    fig = go.Figure()
-    
-    # Add candlestick chart
-    fig.add_trace(go.Candlestick(
+    # Candlestick chart with volume as a bar chart at the bottom
+    candlestick = go.Candlestick(
         x=df.index,
         open=df['Open'],
         high=df['High'],
         low=df['Low'],
         close=df['Close'],
         name='Price'
-    ))
-    
-    # Add volume as a bar chart at the bottom
-    fig.add_trace(go.Bar(
+    )
+    volume = go.Bar(
         x=df.index,
         y=df['Volume'],
         name='Volume',
         marker=dict(color='rgba(128, 128, 128, 0.5)'),
         yaxis='y2'
-    ))
+    )
+    
+    fig = go.Figure(data=[candlestick, volume])
     
     # Layout
     fig.update_layout(
@@ -56,13 +108,14 @@ def create_candlestick_chart(df, title):
         yaxis_title='Price (USD)',
         template='plotly_dark',
         xaxis_rangeslider_visible=False,
+        xaxis_range=indicators['x_range'],
         height=600,
         yaxis2=dict(
             title='Volume',
             overlaying='y',
             side='right',
             showgrid=False,
-            range=[0, df['Volume'].max() * 5]
+            range=[0, indicators['vol_max'] * 5]
         ),
         legend=dict(
             orientation="h",
@@ -75,33 +128,29 @@ def create_candlestick_chart(df, title):
     
     return fig
 
-def create_technical_chart(df, title):
+def create_technical_chart(df, indicators, title):
     """Create technical analysis chart with moving averages"""
-    # Calculate moving averages
-    df_ma = calculate_moving_averages(df)
-    
-    fig = go.Figure()
-    
-    # Add price line
-    fig.add_trace(go.Scatter(
-        x=df_ma.index,
-        y=df_ma['Close'],
+    # Price line followed by the moving averages
+    traces = [go.Scatter(
+        x=df.index,
+        y=df['Close'],
         mode='lines',
         name='Close Price',
         line=dict(color='#1E88E5', width=2)
-    ))
+    )]
+    traces.extend(
+        go.Scatter(
+            x=df.index,
+            y=moving_average,
+            mode='lines',
+            name=f'{window}-day MA',
+            line=dict(color=color, width=1.5, dash='dot')
+        )
+        for (window, moving_average), color in zip(indicators['moving_averages'].items(), MA_COLORS)
+    )
     
-    # Add moving averages
-    colors = ['#F44336', '#4CAF50', '#FF9800']
-    for i, window in enumerate([20, 50, 200]):
-        if f'MA{window}' in df_ma.columns:
-            fig.add_trace(go.Scatter(
-                x=df_ma.index,
-                y=df_ma[f'MA{window}'],
-                mode='lines',
-                name=f'{window}-day MA',
-                line=dict(color=colors[i], width=1.5, dash='dot')
-            ))
+    # Build the figure from all traces at once
+    fig = go.Figure(data=traces)
     
     # Layout
     fig.update_layout(
@@ -121,17 +170,14 @@ def create_technical_chart(df, title):
     
     return fig
 
-def create_rsi_chart(df, title):
+def create_rsi_chart(df, indicators, title):
     """Create RSI (Relative Strength Index) chart"""
-    # Calculate RSI
-    rsi = calculate_rsi(df)
-    
     fig = go.Figure()
     
     # Add RSI line
     fig.add_trace(go.Scatter(
         x=df.index,
-        y=rsi,
+        y=indicators['rsi'],
         mode='lines',
         name='RSI',
         line=dict(color='#1E88E5', width=2)
@@ -168,27 +214,35 @@ def create_rsi_chart(df, title):
     
     return fig
 
-def create_returns_chart(df, title):
+def create_returns_chart(df, indicators, title):
     """Create returns distribution chart"""
-    # Calculate daily returns
-    df_returns = df.copy()
-    df_returns['Daily_Return'] = df_returns['Close'].pct_change() * 100
-    df_returns = df_returns.dropna()
-    
-    fig = px.histogram(
-        df_returns, 
-        x='Daily_Return',
-        nbins=50,
+    daily_returns = indicators['returns']
+    mean_return = daily_returns.mean()
+    
+    # Bin server-side so the browser only draws bars, without per-bar outlines
+    counts, edges = np.histogram(daily_returns.to_numpy(), bins=50)
+    centers = (edges[:-1] + edges[1:]) / 2
+    
+    fig = go.Figure(go.Bar(
+        x=centers,
+        y=counts,
+        width=edges[1] - edges[0],
+        name='Daily Return',
+        marker_line_width=0
+    ))
+    fig.update_layout(
         title=title,
-        labels={'Daily_Return': 'Daily Return (%)'},
+        xaxis_title='Daily Return (%)',
+        yaxis_title='count',
         template='plotly_dark',
+        bargap=0
     )
     
     fig.add_vline(
-        x=df_returns['Daily_Return'].mean(), 
+        x=mean_return, 
         line_dash="dash", 
         line_color="white",
-        annotation_text=f"Mean: {df_returns['Daily_Return'].mean():.2f}%",
+        annotation_text=f"Mean: {mean_return:.2f}%",
         annotation_position="top right"
     )
     
@@ -196,6 +250,27 @@ def create_returns_chart(df, title):
     
     return fig
 
+def create_volume_chart(df, title):
+    """Create trading volume bar chart"""
+    fig = go.Figure(go.Bar(x=df.index, y=df['Volume']))
+    
+    fig.update_layout(
+        title=title,
+        template='plotly_dark',
+        xaxis_title='Date',
+        yaxis_title='Volume',
+        height=400
+    )
+    
+    return fig
+
+def session_figure(key, build):
+    """Return the figure stored in session_state under key, building it on first use"""
+    figs = st.session_state.setdefault('figs', {})
+    if key not in figs:
+        figs[key] = build()
+    return figs[key]
+
 def show_visualization():
     """Show the visualization page"""
     if st.session_state.stock_data is None or st.session_state.selected_stock is None:
@@ -208,6 +283,15 @@ def show_visualization():
     stock_data = st.session_state.stock_data
     ticker = st.session_state.selected_stock
     historical_data = stock_data["history"]
+    indicators = compute_all_indicators(ticker, historical_data)
+    # Charts get a float32 copy, halving the bytes sent to the browser
+    plot_data = downcast_ohlcv(historical_data)
+    
+    # Drop figures stored for a previously loaded price history
+    data_key = (ticker, len(historical_data), historical_data.index[-1])
+    if st.session_state.get('figs_data_key') != data_key:
+        st.session_state.figs_data_key = data_key
+        st.session_state.figs = {}
     
     st.title(f"Visualization: {stock_data['info'].get('shortName', ticker)} ({ticker})")
     
@@ -221,16 +305,18 @@ def show_visualization():
     )
     
     if chart_type == "Line Chart":
-        fig = create_technical_chart(
-            historical_data, 
+        fig = session_figure((ticker, chart_type), lambda: create_technical_chart(
+            plot_data, 
+            indicators,
             f"{ticker} Price with Moving Averages"
-        )
+        ))
         st.plotly_chart(fig, use_container_width=True)
     else:
-        fig = create_candlestick_chart(
-            historical_data, 
+        fig = session_figure((ticker, chart_type), lambda: create_candlestick_chart(
+            plot_data, 
+            indicators,
             f"{ticker} Candlestick Chart"
-        )
+        ))
         st.plotly_chart(fig, use_container_width=True)
     
     # Technical Indicators Section
@@ -239,17 +325,19 @@ def show_visualization():
     col1, col2 = st.columns(2)
     
     with col1:
-        rsi_fig = create_rsi_chart(
-            historical_data, 
+        rsi_fig = session_figure((ticker, 'RSI'), lambda: create_rsi_chart(
+            plot_data, 
+            indicators,
             f"{ticker} RSI (Relative Strength Index)"
-        )
+        ))
         st.plotly_chart(rsi_fig, use_container_width=True)
     
     with col2:
-        returns_fig = create_returns_chart(
-            historical_data, 
+        returns_fig = session_figure((ticker, 'Returns'), lambda: create_returns_chart(
+            plot_data, 
+            indicators,
             f"{ticker} Daily Returns Distribution"
-        )
+        ))
         st.plotly_chart(returns_fig, use_container_width=True)
     
     # Performance Summary
@@ -257,32 +345,22 @@ def show_visualization():
     
     # Calculate performance metrics
     try:
-        # Get first and last closing prices
-        start_price = historical_data['Close'].iloc[0]
-        end_price = historical_data['Close'].iloc[-1]
-        
-        # Calculate performance metrics
-        total_return = ((end_price - start_price) / start_price) * 100
-        daily_returns = historical_data['Close'].pct_change().dropna()
-        annualized_return = daily_returns.mean() * 252 * 100
-        volatility = daily_returns.std() * np.sqrt(252) * 100
-        sharpe_ratio = annualized_return / volatility if volatility != 0 else 0
-        max_drawdown = ((historical_data['Close'].cummax() - historical_data['Close']) / historical_data['Close'].cummax()).max() * 100
+        metrics = compute_metrics(ticker, historical_data, indicators)
         
         # Display metrics
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Total Return", f"{total_return:.2f}%")
-            st.metric("Annualized Return", f"{annualized_return:.2f}%")
+            st.metric("Total Return", f"{metrics.total_return:.2f}%")
+            st.metric("Annualized Return", f"{metrics.annualized_return:.2f}%")
         
         with col2:
-            st.metric("Volatility (Annualized)", f"{volatility:.2f}%")
-            st.metric("Sharpe Ratio", f"{sharpe_ratio:.2f}")
+            st.metric("Volatility (Annualized)", f"{metrics.volatility:.2f}%")
+            st.metric("Sharpe Ratio", f"{metrics.sharpe_ratio:.2f}")
         
         with col3:
-            st.metric("Maximum Drawdown", f"{max_drawdown:.2f}%")
-            st.metric("Average Daily Volume", f"{historical_data['Volume'].mean():.0f}")
+            st.metric("Maximum Drawdown", f"{metrics.max_drawdown:.2f}%")
+            st.metric("Average Daily Volume", f"{metrics.avg_volume:.0f}")
     
     except Exception as e:
         st.error(f"Error calculating performance metrics: {str(e)}")
@@ -290,19 +368,9 @@ def show_visualization():
     # Trading Volume Analysis
     st.subheader("Trading Volume Analysis")
     
-    volume_fig = px.bar(
-        historical_data, 
-        x=historical_data.index, 
-        y='Volume',
-        title=f"{ticker} Trading Volume",
-        template='plotly_dark',
-    )
-    
-    volume_fig.update_layout(
-        xaxis_title='Date',
-        yaxis_title='Volume',
-        height=400
-    )
+    volume_fig = session_figure((ticker, 'Volume'), lambda: create_volume_chart(
+        plot_data, f"{ticker} Trading Volume"
+    ))
     
     st.plotly_chart(volume_fig, use_container_width=True)
     